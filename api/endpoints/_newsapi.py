@@ -0,0 +1,139 @@
+"""Shared upstream-call helper for the NewsAPI proxy endpoints."""
+import itertools
+import logging
+import os
+import time
+
+import httpx
+import orjson
+from fastapi import HTTPException, status
+
+from core.cache import NotModified
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NEWS_API_URL = settings.NEWS_API_URL
+
+# Multiple keys so a rate-limited or rejected key can cool down while the
+# others keep serving.
+NEWS_API_KEYS = [key for key in (
+    settings.NEWS_API_KEY,
+    os.getenv("NEWS_API_KEY_2"),
+    os.getenv("NEWS_API_KEY_3"),
+) if key]
+
+# Round-robin over the keys; no lock needed since the event loop never
+# preempts between next() calls, unlike random.choice's module-state lock.
+_key_iter = itertools.cycle(NEWS_API_KEYS)
+
+# Key -> monotonic time until which it should be skipped.
+_key_cooldown: dict = {}
+KEY_COOLDOWN_SECONDS = 60
+
+
+def next_api_key() -> str:
+    """Return the next usable API key, skipping ones in cooldown.
+
+    If every key is cooling down, the last one scanned is returned anyway
+    so the caller still gets a definitive upstream answer.
+    """
+    now = time.monotonic()
+    key = NEWS_API_KEYS[0]
+    for _ in range(len(NEWS_API_KEYS)):
+        key = next(_key_iter)
+        if _key_cooldown.get(key, 0) <= now:
+            return key
+    return key
+
+# Shared client so every request reuses pooled keep-alive connections to
+# NewsAPI instead of paying a fresh TCP+TLS handshake per call.
+# Closed on application shutdown via the lifespan context in main.py.
+# http2=True lets concurrent upstream calls multiplex over one connection
+# instead of opening a TCP connection each under HTTP/1.1.
+NEWS_CLIENT = httpx.AsyncClient(
+    base_url=NEWS_API_URL,
+    timeout=10.0,
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
+
+async def newsapi_get(path: str, params: dict, headers: dict = None) -> tuple:
+    """GET a NewsAPI path and return `(payload, validators)`.
+
+    `validators` carries the response ETag/Last-Modified headers so callers
+    can revalidate with a conditional GET later; a 304 reply to such a GET
+    raises NotModified. Every upstream failure mode (auth, rate limit,
+    timeouts, connection errors, NewsAPI-level errors) is translated into
+    the appropriate HTTPException so the endpoints don't have to.
+    """
+    api_key = next_api_key()
+    try:
+        response = await NEWS_CLIENT.get(path, params={**params, "apiKey": api_key}, headers=headers)
+
+        # Log the request details for debugging; guard so disabled levels
+        # don't even pay for touching response.request.url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request URL: %s", response.request.url)
+            logger.debug("Response status: %s", response.status_code)
+
+        # Handle different HTTP status codes
+        if response.status_code == 401:
+            logger.error("NewsAPI authentication failed. Invalid API key.")
+            _key_cooldown[api_key] = time.monotonic() + KEY_COOLDOWN_SECONDS
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="NewsAPI authentication failed. Please check your API key."
+            )
+        elif response.status_code == 429:
+            logger.error("NewsAPI rate limit exceeded.")
+            _key_cooldown[api_key] = time.monotonic() + KEY_COOLDOWN_SECONDS
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="NewsAPI rate limit exceeded. Please try again later."
+            )
+        elif response.status_code == 304:
+            raise NotModified()
+
+        response.raise_for_status()
+        # orjson is 2-3x faster than stdlib json on the larger payloads
+        data = orjson.loads(response.content)
+
+        # Check if the API returned an error
+        if data.get("status") == "error":
+            error_message = data.get("message", "Unknown error from NewsAPI")
+            logger.error("NewsAPI error: %s", error_message)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"NewsAPI error: {error_message}"
+            )
+
+        validators = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        return data, validators
+    except (HTTPException, NotModified):
+        raise
+    except httpx.TimeoutException:
+        logger.error("Request to NewsAPI timed out")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Request to NewsAPI timed out. Please try again later."
+        )
+    except httpx.HTTPStatusError as e:
+        logger.error("HTTP error occurred: %s", e)
+        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
+    except httpx.RequestError as e:
+        logger.error("Request error occurred: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not connect to NewsAPI. Please try again later."
+        )
+    except Exception as e:
+        logger.exception("Unexpected error when calling NewsAPI: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while processing your request."
+        )
@@ -1,251 +1,255 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, insert, or_, select
 from db.session import get_db
 from db.models import News
 from core.security import verify_token
+from fastapi_cache.decorator import cache
+from core.cache import redis_client, serve_or_stale, stale_key
+from api.endpoints._newsapi import NEWS_CLIENT, newsapi_get
 import httpx
+import asyncio
+import orjson
 from datetime import datetime, timedelta
 import uuid
 import logging
 from typing import Optional, List
 from core.config import settings
 
+try:
+    # C parser, ~20x faster than datetime.fromisoformat and handles the
+    # trailing "Z" natively, so no per-article string allocation.
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 NEWS_API_URL = settings.NEWS_API_URL
 NEWS_API_KEY = settings.NEWS_API_KEY
 
+# In-flight upstream calls keyed by cache key. Concurrent requests for the
+# same key await a single NewsAPI round-trip instead of stampeding upstream
+# before the Redis cache is populated.
+_inflight: dict = {}
+
+async def fetch_once(key, coro_factory):
+    """Coalesce concurrent identical upstream fetches into one call.
+
+    The first caller for a key performs the fetch; every other caller that
+    arrives while it is in flight awaits the same result (or exception).
+    """
+    existing = _inflight.get(key)
+    if existing is not None:
+        return await existing
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await coro_factory()
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved in case nobody else is waiting
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _proxy_newsapi(path: str, params: dict, page: int = None, page_size: int = None):
+    """Fetch a NewsAPI path with single-flight coalescing and stale fallback.
+
+    When `page`/`page_size` are given, pagination metadata is attached to
+    the payload *before* serve_or_stale stores it, so stale and 304-revived
+    copies come back in the same shape as fresh responses.
+    """
+    key = stale_key(path, params)
+
+    async def fetch(headers=None):
+        data, validators = await fetch_once(key, lambda: newsapi_get(path, params, headers=headers))
+        if page is not None:
+            data = _attach_pagination(data, page, page_size)
+        return data, validators
+
+    return await serve_or_stale(key, fetch)
+
+
+def make_pagination(page: int, page_size: int, total_items: int) -> dict:
+    """Pagination metadata block shared by the listing and proxy endpoints."""
+    total_pages = -(-total_items // page_size)  # ceiling division, no floats
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total_items": total_items,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1
+    }
+
+
+def _attach_pagination(data: dict, page: int, page_size: int) -> dict:
+    """Add pagination metadata to an upstream response if not present."""
+    if "totalResults" in data and "articles" in data:
+        data["pagination"] = make_pagination(page, page_size, data["totalResults"])
+    return data
+
+
+async def _cached_news_count(db: AsyncSession) -> int:
+    """Total row count for pagination metadata, cached briefly in Redis.
+
+    An exact COUNT scans the whole (append-only) news table, so a slightly
+    stale figure is an acceptable trade for skipping that scan per request.
+    """
+    try:
+        cached = await redis_client.get("news:count")
+        if cached is not None:
+            return int(cached)
+    except Exception as e:
+        logger.warning("Could not read cached news count: %s", e)
+
+    total_count = await db.scalar(select(func.count(News.id)))
+    try:
+        await redis_client.set("news:count", total_count, ex=30)
+    except Exception as e:
+        logger.warning("Could not store cached news count: %s", e)
+    return total_count
+
+
 @router.get("/")
 async def get_news(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    before: Optional[datetime] = Query(None, description="Keyset cursor: only items published before this timestamp"),
+    before_id: Optional[str] = Query(None, description="Keyset cursor tie-break: id of the last item on the previous page"),
+    db: AsyncSession = Depends(get_db),
     token: str = Depends(verify_token)
 ):
-    # Calculate pagination parameters
-    skip = (page - 1) * page_size
+    # Core select of just the response columns: skips ORM object hydration
+    # and attribute instrumentation, which dominate per-row cost here.
+    # The id tie-break matches the composite index and keeps the order
+    # deterministic when several rows share a timestamp.
+    stmt = select(
+        News.id, News.title, News.description, News.url, News.published_at
+    ).order_by(News.published_at.desc(), News.id)
+
+    if before is not None:
+        # Keyset pagination: a direct index range scan with no OFFSET cost.
+        # The composite comparison keeps rows that tie on the boundary
+        # timestamp instead of silently skipping them.
+        if before_id is not None:
+            stmt = stmt.where(
+                or_(
+                    News.published_at < before,
+                    and_(News.published_at == before, News.id > before_id),
+                )
+            )
+        else:
+            stmt = stmt.where(News.published_at < before)
+    else:
+        # Calculate pagination parameters
+        skip = (page - 1) * page_size
+        stmt = stmt.offset(skip)
 
-    # Get total count for pagination metadata
-    total_count = db.query(News).count()
+    news_items = (await db.execute(stmt.limit(page_size))).all()
 
-    # Get paginated news items
-    news_items = db.query(News).order_by(desc(News.published_at)).offset(skip).limit(page_size).all()
+    # Get total count for pagination metadata
+    total_count = await _cached_news_count(db)
 
     # Calculate pagination metadata
-    total_pages = (total_count + page_size - 1) // page_size
-    has_next = page < total_pages
-    has_prev = page > 1
+    pagination = make_pagination(page, page_size, total_count)
+
+    # Cursor for the next page; clients should prefer this over page numbers.
+    if len(news_items) == page_size:
+        pagination["next_before"] = news_items[-1].published_at
+        pagination["next_before_id"] = news_items[-1].id
+    else:
+        pagination["next_before"] = None
+        pagination["next_before_id"] = None
 
     # Format response
     return {
-        "items": [{
-            "id": item.id,
-            "title": item.title,
-            "description": item.description,
-            "url": item.url,
-            "published_at": item.published_at
-        } for item in news_items],
-        "pagination": {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total_count,
-            "total_pages": total_pages,
-            "has_next": has_next,
-            "has_prev": has_prev
-        }
+        "items": [dict(row._mapping) for row in news_items],
+        "pagination": pagination
     }
 
 @router.post("/save-latest")
-async def save_latest_news(db: Session = Depends(get_db), token: str = Depends(verify_token)):
+async def save_latest_news(db: AsyncSession = Depends(get_db), token: str = Depends(verify_token)):
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/top-headlines",
-                params={"apiKey": NEWS_API_KEY, "country": "us", "pageSize": 3},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("status") != "ok":
-                raise HTTPException(status_code=500, detail="Failed to fetch news from external API")
-
-            saved_count = 0
-            for article in data.get("articles", [])[:3]:
-
-                published_at = datetime.fromisoformat(article.get("publishedAt", "").replace("Z", "+00:00"))
-
-
-                news_item = News(
-                    id=str(uuid.uuid4()),
-                    title=article.get("title", ""),
-                    description=article.get("description", ""),
-                    url=article.get("url", ""),
-                    published_at=published_at
-                )
-
-                db.add(news_item)
-                saved_count += 1
-
-            db.commit()
-            return {"message": f"Successfully saved {saved_count} news articles"}
+        response = await NEWS_CLIENT.get(
+            "/top-headlines",
+            params={"apiKey": NEWS_API_KEY, "country": "us", "pageSize": 3},
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        if data.get("status") != "ok":
+            raise HTTPException(status_code=500, detail="Failed to fetch news from external API")
+
+        rows = []
+        for article in data.get("articles", [])[:3]:
+
+            published_at = parse_datetime(article.get("publishedAt", ""))
+
+            rows.append({
+                "id": uuid.uuid4().hex,
+                "title": article.get("title", ""),
+                "description": article.get("description", ""),
+                "url": article.get("url", ""),
+                "published_at": published_at
+            })
+
+        # Single multi-row INSERT instead of per-row ORM adds.
+        if rows:
+            await db.execute(insert(News), rows)
+        await db.commit()
+        return {"message": f"Successfully saved {len(rows)} news articles"}
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error occurred: {e}")
+        logger.error("HTTP error occurred: %s", e)
         raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
     except Exception as e:
-        logger.error(f"Error saving latest news: {e}")
-        db.rollback()
+        logger.error("Error saving latest news: %s", e)
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Error saving latest news: {str(e)}")
 
 @router.get("/headlines/country/{country_code}")
+@cache(expire=30)
 async def get_headlines_by_country(
     country_code: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     token: str = Depends(verify_token)
 ):
-    try:
-        logger.info(f"Fetching headlines for country: {country_code}, page: {page}, page_size: {page_size}")
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/top-headlines",
-                params={
-                    "apiKey": NEWS_API_KEY,
-                    "country": country_code,
-                    "page": page,
-                    "pageSize": page_size
-                },
-            )
-
-            # Log the request details for debugging
-            logger.debug(f"Request URL: {response.request.url}")
-            logger.debug(f"Response status: {response.status_code}")
-
-            # Handle different HTTP status codes
-            if response.status_code == 401:
-                logger.error("NewsAPI authentication failed. Invalid API key.")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="NewsAPI authentication failed. Please check your API key."
-                )
-            elif response.status_code == 429:
-                logger.error("NewsAPI rate limit exceeded.")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="NewsAPI rate limit exceeded. Please try again later."
-                )
-
-            response.raise_for_status()
-            data = response.json()
-
-            # Check if the API returned an error
-            if data.get("status") == "error":
-                error_message = data.get("message", "Unknown error from NewsAPI")
-                logger.error(f"NewsAPI error: {error_message}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"NewsAPI error: {error_message}"
-                )
-
-            return data
-    except httpx.TimeoutException:
-        logger.error("Request to NewsAPI timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Request to NewsAPI timed out. Please try again later."
-        )
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
-    except httpx.RequestError as e:
-        logger.error(f"Request error occurred: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not connect to NewsAPI. Please try again later."
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching headlines: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request."
-        )
+    logger.info("Fetching headlines for country: %s, page: %s, page_size: %s", country_code, page, page_size)
+    params = {
+        "country": country_code,
+        "page": page,
+        "pageSize": page_size
+    }
+    return await _proxy_newsapi("/top-headlines", params)
 
 @router.get("/headlines/source/{source_id}")
+@cache(expire=30)
 async def get_headlines_by_source(
     source_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     token: str = Depends(verify_token)
 ):
-    try:
-        logger.info(f"Fetching headlines for source: {source_id}, page: {page}, page_size: {page_size}")
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/top-headlines",
-                params={
-                    "apiKey": NEWS_API_KEY,
-                    "sources": source_id,
-                    "page": page,
-                    "pageSize": page_size
-                },
-            )
-
-            # Log the request details for debugging
-            logger.debug(f"Request URL: {response.request.url}")
-            logger.debug(f"Response status: {response.status_code}")
-
-            # Handle different HTTP status codes
-            if response.status_code == 401:
-                logger.error("NewsAPI authentication failed. Invalid API key.")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="NewsAPI authentication failed. Please check your API key."
-                )
-            elif response.status_code == 429:
-                logger.error("NewsAPI rate limit exceeded.")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="NewsAPI rate limit exceeded. Please try again later."
-                )
-
-            response.raise_for_status()
-            data = response.json()
-
-            # Check if the API returned an error
-            if data.get("status") == "error":
-                error_message = data.get("message", "Unknown error from NewsAPI")
-                logger.error(f"NewsAPI error: {error_message}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"NewsAPI error: {error_message}"
-                )
-
-            return data
-    except httpx.TimeoutException:
-        logger.error("Request to NewsAPI timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Request to NewsAPI timed out. Please try again later."
-        )
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
-    except httpx.RequestError as e:
-        logger.error(f"Request error occurred: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not connect to NewsAPI. Please try again later."
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching headlines: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request."
-        )
+    logger.info("Fetching headlines for source: %s, page: %s, page_size: %s", source_id, page, page_size)
+    params = {
+        "sources": source_id,
+        "page": page,
+        "pageSize": page_size
+    }
+    return await _proxy_newsapi("/top-headlines", params)
 
 @router.get("/headlines/filter")
+@cache(expire=30)
 async def get_headlines_by_filter(
     country: str = Query(None, description="Country code (e.g., 'us', 'gb')"),
     source: str = Query(None, description="Source ID (e.g., 'bbc-news')"),
@@ -256,91 +260,20 @@ async def get_headlines_by_filter(
     if not country and not source:
         raise HTTPException(status_code=400, detail="At least one filter parameter (country or source) is required")
 
-    try:
-        logger.info(f"Fetching headlines with filters - country: {country}, source: {source}, page: {page}, page_size: {page_size}")
-        params = {
-            "apiKey": NEWS_API_KEY,
-            "page": page,
-            "pageSize": page_size
-        }
-        if country:
-            params["country"] = country
-        if source:
-            params["sources"] = source
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/top-headlines",
-                params=params,
-            )
-
-            # Log the request details for debugging
-            logger.debug(f"Request URL: {response.request.url}")
-            logger.debug(f"Response status: {response.status_code}")
-
-            # Handle different HTTP status codes
-            if response.status_code == 401:
-                logger.error("NewsAPI authentication failed. Invalid API key.")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="NewsAPI authentication failed. Please check your API key."
-                )
-            elif response.status_code == 429:
-                logger.error("NewsAPI rate limit exceeded.")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="NewsAPI rate limit exceeded. Please try again later."
-                )
-
-            response.raise_for_status()
-            data = response.json()
-
-            # Check if the API returned an error
-            if data.get("status") == "error":
-                error_message = data.get("message", "Unknown error from NewsAPI")
-                logger.error(f"NewsAPI error: {error_message}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"NewsAPI error: {error_message}"
-                )
+    logger.info("Fetching headlines with filters - country: %s, source: %s, page: %s, page_size: %s", country, source, page, page_size)
+    params = {
+        "page": page,
+        "pageSize": page_size
+    }
+    if country:
+        params["country"] = country
+    if source:
+        params["sources"] = source
 
-            # Add pagination metadata if not present in the response
-            if "totalResults" in data and "articles" in data:
-                total_results = data["totalResults"]
-                total_pages = (total_results + page_size - 1) // page_size
-                data["pagination"] = {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_results,
-                    "total_pages": total_pages,
-                    "has_next": page < total_pages,
-                    "has_prev": page > 1
-                }
-
-            return data
-    except httpx.TimeoutException:
-        logger.error("Request to NewsAPI timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Request to NewsAPI timed out. Please try again later."
-        )
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
-    except httpx.RequestError as e:
-        logger.error(f"Request error occurred: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not connect to NewsAPI. Please try again later."
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching headlines: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request."
-        )
+    return await _proxy_newsapi("/top-headlines", params, page=page, page_size=page_size)
 
 @router.get("/everything")
+@cache(expire=60)
 async def search_news(
     q: str = Query(..., description="Keywords or phrases to search for in the article title and body"),
     from_date: Optional[str] = Query(None, alias="from", description="A date and optional time for the oldest article allowed"),
@@ -355,99 +288,28 @@ async def search_news(
     Search through millions of articles from over 80,000 large and small news sources and blogs.
     This endpoint is great for news analysis and article discovery.
     """
-    try:
-        logger.info(f"Searching news with query: {q}, from: {from_date}, to: {to_date}, language: {language}, sort_by: {sort_by}")
-
-        # Build parameters
-        params = {
-            "apiKey": NEWS_API_KEY,
-            "q": q,
-            "page": page,
-            "pageSize": page_size,
-            "sortBy": sort_by
-        }
-
-        # Add optional parameters if provided
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        if language:
-            params["language"] = language
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/everything",
-                params=params,
-            )
-
-            # Log the request details for debugging
-            logger.debug(f"Request URL: {response.request.url}")
-            logger.debug(f"Response status: {response.status_code}")
-
-            # Handle different HTTP status codes
-            if response.status_code == 401:
-                logger.error("NewsAPI authentication failed. Invalid API key.")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="NewsAPI authentication failed. Please check your API key."
-                )
-            elif response.status_code == 429:
-                logger.error("NewsAPI rate limit exceeded.")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="NewsAPI rate limit exceeded. Please try again later."
-                )
+    logger.info("Searching news with query: %s, from: %s, to: %s, language: %s, sort_by: %s", q, from_date, to_date, language, sort_by)
+
+    # Build parameters
+    params = {
+        "q": q,
+        "page": page,
+        "pageSize": page_size,
+        "sortBy": sort_by
+    }
 
-            response.raise_for_status()
-            data = response.json()
+    # Add optional parameters if provided
+    if from_date:
+        params["from"] = from_date
+    if to_date:
+        params["to"] = to_date
+    if language:
+        params["language"] = language
 
-            # Check if the API returned an error
-            if data.get("status") == "error":
-                error_message = data.get("message", "Unknown error from NewsAPI")
-                logger.error(f"NewsAPI error: {error_message}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"NewsAPI error: {error_message}"
-                )
-
-            # Add pagination metadata if not present in the response
-            if "totalResults" in data and "articles" in data:
-                total_results = data["totalResults"]
-                total_pages = (total_results + page_size - 1) // page_size
-                data["pagination"] = {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_results,
-                    "total_pages": total_pages,
-                    "has_next": page < total_pages,
-                    "has_prev": page > 1
-                }
-
-            return data
-    except httpx.TimeoutException:
-        logger.error("Request to NewsAPI timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Request to NewsAPI timed out. Please try again later."
-        )
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
-    except httpx.RequestError as e:
-        logger.error(f"Request error occurred: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not connect to NewsAPI. Please try again later."
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected error when searching news: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request."
-        )
+    return await _proxy_newsapi("/everything", params, page=page, page_size=page_size)
 
 @router.get("/sources")
+@cache(expire=60)
 async def get_sources(
     category: Optional[str] = Query(None, description="Find sources that display news of this category"),
     language: Optional[str] = Query(None, description="Find sources that display news in a specific language"),
@@ -458,75 +320,17 @@ async def get_sources(
     This endpoint returns the subset of news publishers that top headlines are available from.
     It's mainly used to obtain a list of all possible sources/publishers available in the system.
     """
-    try:
-        logger.info(f"Fetching sources with category: {category}, language: {language}, country: {country}")
-
-        # Build parameters
-        params = {"apiKey": NEWS_API_KEY}
-
-        # Add optional parameters if provided
-        if category:
-            params["category"] = category
-        if language:
-            params["language"] = language
-        if country:
-            params["country"] = country
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWS_API_URL}/top-headlines/sources",
-                params=params,
-            )
-
-            # Log the request details for debugging
-            logger.debug(f"Request URL: {response.request.url}")
-            logger.debug(f"Response status: {response.status_code}")
-
-            # Handle different HTTP status codes
-            if response.status_code == 401:
-                logger.error("NewsAPI authentication failed. Invalid API key.")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="NewsAPI authentication failed. Please check your API key."
-                )
-            elif response.status_code == 429:
-                logger.error("NewsAPI rate limit exceeded.")
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="NewsAPI rate limit exceeded. Please try again later."
-                )
+    logger.info("Fetching sources with category: %s, language: %s, country: %s", category, language, country)
 
-            response.raise_for_status()
-            data = response.json()
+    # Build parameters
+    params = {}
 
-            # Check if the API returned an error
-            if data.get("status") == "error":
-                error_message = data.get("message", "Unknown error from NewsAPI")
-                logger.error(f"NewsAPI error: {error_message}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"NewsAPI error: {error_message}"
-                )
+    # Add optional parameters if provided
+    if category:
+        params["category"] = category
+    if language:
+        params["language"] = language
+    if country:
+        params["country"] = country
 
-            return data
-    except httpx.TimeoutException:
-        logger.error("Request to NewsAPI timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Request to NewsAPI timed out. Please try again later."
-        )
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error occurred: {e}")
-        raise HTTPException(status_code=500, detail=f"HTTP error occurred: {str(e)}")
-    except httpx.RequestError as e:
-        logger.error(f"Request error occurred: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not connect to NewsAPI. Please try again later."
-        )
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching sources: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while processing your request."
-        )
\ No newline at end of file
+    return await _proxy_newsapi("/top-headlines/sources", params)
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+logger = logging.getLogger(__name__)
+
+# Shared Redis client for rate limiting, response caching and the stale
+# fallback below. Connection errors are tolerated everywhere it is used.
+redis_client = redis.from_url("redis://localhost")
+
+# How long a stale copy of an upstream response is kept around (24h). Stale
+# entries are only served when the upstream call fails, so a long TTL is safe.
+STALE_TTL = 60 * 60 * 24
+
+# Upstream failures that justify falling back to a stale copy: rate limiting
+# and server-side/transport errors. Client errors (400, 401) are not retried.
+_STALE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class NotModified(Exception):
+    """Upstream returned 304: the cached copy is still valid."""
+
+
+def newsapi_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+) -> str:
+    """Build a cache key from the request path and sorted query parameters.
+
+    The authenticated user is deliberately left out of the key: the proxied
+    NewsAPI data is public, so cached entries can be shared across users.
+    """
+    if request is not None:
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        raw = f"{request.url.path}?{query}"
+    else:
+        raw = f"{func.__module__}.{func.__name__}:{sorted((kwargs or {}).items())}"
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def stale_key(path: str, params: dict) -> str:
+    """Build the Redis key for the stale copy of an upstream NewsAPI call."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items()) if k != "apiKey")
+    digest = hashlib.md5(f"{path}?{query}".encode()).hexdigest()
+    return f"news:stale:{digest}"
+
+
+async def serve_or_stale(key: str, fetch_coro: Callable[..., Awaitable[tuple]]) -> Any:
+    """Run an upstream fetch, falling back to the last stale copy on failure.
+
+    Successful responses are stored under `key` (body plus ETag/Last-Modified
+    validators) with a long TTL. When validators are on hand they are sent as
+    conditional headers so upstream can answer 304 and we revive the stored
+    body instead of re-downloading it. If the fetch raises an HTTPException
+    for a transient upstream failure (429/5xx), the stale copy is served
+    instead with an `X-Cache: STALE` header; the original error is re-raised
+    only when no stale copy exists.
+
+    `fetch_coro` must accept an optional headers dict and return a
+    `(data, validators)` tuple, as `newsapi_get` does.
+    """
+    try:
+        entry = await redis_client.hgetall(key)
+    except Exception as e:
+        logger.warning("Could not read stale cache entry %s: %s", key, e)
+        entry = {}
+
+    cond_headers = {}
+    if entry.get(b"etag"):
+        cond_headers["If-None-Match"] = entry[b"etag"].decode()
+    if entry.get(b"last_modified"):
+        cond_headers["If-Modified-Since"] = entry[b"last_modified"].decode()
+
+    try:
+        data, validators = await fetch_coro(cond_headers or None)
+    except NotModified:
+        body = entry.get(b"body")
+        if body is not None:
+            # The stored body is still fresh upstream: extend its lifetime
+            # and serve it without re-parsing a full download.
+            try:
+                await redis_client.expire(key, STALE_TTL)
+            except Exception as e:
+                logger.warning("Could not refresh stale cache entry %s: %s", key, e)
+            return json.loads(body)
+        # A coalesced waiter can share the leader's 304 without holding the
+        # cached entry itself (its hgetall may have failed above). Without a
+        # body to revive, re-fetch unconditionally instead of crashing.
+        logger.warning("Got 304 for %s with no cached body; refetching", key)
+        data, validators = await fetch_coro(None)
+    except HTTPException as exc:
+        if exc.status_code not in _STALE_STATUS_CODES:
+            raise
+        stale = entry.get(b"body")
+        if stale is not None:
+            logger.info("Serving stale cached response for %s", key)
+            return JSONResponse(content=json.loads(stale), headers={"X-Cache": "STALE"})
+        raise
+
+    mapping = {"body": json.dumps(data, default=str)}
+    if validators.get("etag"):
+        mapping["etag"] = validators["etag"]
+    if validators.get("last_modified"):
+        mapping["last_modified"] = validators["last_modified"]
+    try:
+        await redis_client.hset(key, mapping=mapping)
+        await redis_client.expire(key, STALE_TTL)
+    except Exception as e:
+        logger.warning("Could not store stale cache entry %s: %s", key, e)
+    return data
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     ALLOW_ORIGINS: str = "http://localhost:3000,https://news-frontend.example.com"
 
 
-    model_config = SettingsConfigDict(env_file=".env")
+    # Settings are read-only after startup; frozen avoids accidental writes
+    # and lets pydantic skip validate-on-assignment machinery.
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+# Hot attributes frozen into plain module constants at import time: a module
+# global read is far cheaper than a pydantic attribute descriptor call on
+# per-request paths like the exception handlers.
+DEBUG = settings.DEBUG
+NEWS_API_URL = settings.NEWS_API_URL
+NEWS_API_KEY = settings.NEWS_API_KEY
+ALLOW_ORIGINS = tuple(settings.ALLOW_ORIGINS.split(","))
\ No newline at end of file
@@ -1,11 +1,16 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from db.base import Base
 
 class News(Base):
     __tablename__ = "news"
 
     id = Column(String, primary_key=True, index=True)
-    title = Column(String, index=True)
+    title = Column(String)
     description = Column(String)
     url = Column(String)
-    published_at = Column(DateTime)
\ No newline at end of file
+    published_at = Column(DateTime)
+
+    # Matches the ORDER BY published_at DESC LIMIT pattern of the listing
+    # endpoint so page reads (and keyset WHERE published_at < :cursor) are a
+    # direct index range scan; id breaks ties between equal timestamps.
+    __table_args__ = (Index("ix_news_published_at_desc_id", published_at.desc(), id),)
@@ -1,18 +1,27 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from core.config import settings
 
+def _async_database_url(url: str) -> str:
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+# Async engine for request handlers, so SQL I/O yields to the event loop
+# instead of blocking it.
+engine = create_async_engine(_async_database_url(settings.DATABASE_URL))
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+# Sync engine kept only for schema management.
 connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+sync_engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 def init_db():
     from db.base import Base
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=sync_engine)